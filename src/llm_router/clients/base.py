@@ -1,9 +1,10 @@
 """Base HTTP client with retry and header manipulation."""
 
 import logging
-from typing import Any, AsyncIterator, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import httpx
+import orjson
 
 from ..config import ModelConfig, RetryConfig
 from ..middleware.headers import HeaderManipulator
@@ -14,18 +15,44 @@ from ..utils.retry import RetryHandler
 logger = logging.getLogger(__name__)
 
 
+def create_http_client(ssl_verify: bool = True) -> httpx.AsyncClient:
+    """Create the pooled HTTP client shared by provider clients.
+
+    Timeouts are applied per request, so a single client can serve every
+    model that uses the same SSL verification setting. HTTP/2 is enabled so
+    concurrent requests to the same provider share one connection.
+
+    Args:
+        ssl_verify: Whether to verify SSL certificates
+
+    Returns:
+        HTTP client
+    """
+    return httpx.AsyncClient(
+        verify=ssl_verify,
+        http2=True,
+        follow_redirects=True,
+        limits=httpx.Limits(max_keepalive_connections=100, max_connections=500),
+    )
+
+
 class BaseClient:
     """Base HTTP client for LLM providers."""
 
+    # Endpoint name -> API path, defined by each provider client
+    ROUTES: Dict[str, str] = {}
+
     def __init__(
         self,
         model_config: ModelConfig,
         retry_config: RetryConfig,
         header_manipulator: HeaderManipulator,
         content_transformer: ContentTransformer,
+        http_client: httpx.AsyncClient,
         request_logger: Optional[RequestLogger] = None,
         log_requests: bool = False,
         log_responses: bool = False,
+        stream_chunk_size: Optional[int] = None,
     ):
         """Initialize base client.
 
@@ -34,9 +61,11 @@ class BaseClient:
             retry_config: Retry configuration
             header_manipulator: Header manipulator
             content_transformer: Content transformer
+            http_client: Shared HTTP client (owned by the application)
             request_logger: Request logger
             log_requests: Whether to log requests
             log_responses: Whether to log responses
+            stream_chunk_size: Chunk size for streamed responses (None = as received)
         """
         self.model_config = model_config
         self.retry_handler = RetryHandler(retry_config)
@@ -45,23 +74,62 @@ class BaseClient:
         self.request_logger = request_logger
         self.log_requests = log_requests
         self.log_responses = log_responses
+        self.stream_chunk_size = stream_chunk_size
+        self._do_log_req = bool(log_requests and request_logger)
+        self._do_log_resp = bool(log_responses and request_logger)
+        self._has_transforms = content_transformer.has_enabled_transforms()
+
+        self.client = http_client
+        self._endpoint_base = model_config.endpoint.rstrip("/")
+        self._urls: Dict[str, str] = {}
+        self._timeout = httpx.Timeout(
+            connect=model_config.connect_timeout,
+            read=model_config.timeout,
+            write=model_config.timeout,
+            pool=5.0,
+        )
 
-        # Create HTTP client
-        self.client = httpx.AsyncClient(
-            timeout=httpx.Timeout(
-                connect=model_config.connect_timeout,
-                read=model_config.timeout,
-                write=model_config.timeout,
-                pool=5.0,
-            ),
-            verify=model_config.ssl_verify,
-            follow_redirects=True,
-            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        # Model config and header rules are fixed for the client's lifetime,
+        # so the processed header set is built once and reused per request
+        self._auth_headers = self._build_auth_headers()
+        self._default_headers = {
+            "content-type": "application/json",
+            **dict(self._auth_headers),
+        }
+        self._base_headers = self._with_json_content_type(
+            self.header_manipulator.process_headers(self._default_headers)
         )
 
-    async def close(self) -> None:
-        """Close HTTP client."""
-        await self.client.aclose()
+    def _build_auth_headers(self) -> Tuple[Tuple[str, str], ...]:
+        """Build the authentication headers for the provider.
+
+        Returns:
+            Header name/value pairs (empty if no API key is configured)
+        """
+        api_key = self.model_config.api_key
+        if not api_key:
+            return ()
+
+        if "anthropic" in self.model_config.provider.lower():
+            return (("x-api-key", api_key), ("anthropic-version", "2023-06-01"))
+        return (("authorization", f"Bearer {api_key}"),)
+
+    @staticmethod
+    def _with_json_content_type(headers: Dict[str, str]) -> Dict[str, str]:
+        """Ensure headers declare a JSON content type.
+
+        Bodies are sent pre-serialized, so httpx does not add the header
+        itself if header rules dropped it.
+
+        Args:
+            headers: Processed headers
+
+        Returns:
+            Headers including a content type
+        """
+        if any(key.lower() == "content-type" for key in headers):
+            return headers
+        return {**headers, "content-type": "application/json"}
 
     def _prepare_headers(self, additional_headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
         """Prepare headers for request.
@@ -70,26 +138,51 @@ class BaseClient:
             additional_headers: Additional headers to include
 
         Returns:
-            Processed headers
+            Processed headers (shared, must not be mutated by callers)
         """
-        headers = {
-            "content-type": "application/json",
-        }
+        if not additional_headers:
+            return self._base_headers
+
+        # Apply header manipulation to the merged set so drop rules still
+        # cover the additional headers
+        return self._with_json_content_type(
+            self.header_manipulator.process_headers(
+                {**self._default_headers, **additional_headers}
+            )
+        )
 
-        # Add API key if configured
-        if self.model_config.api_key:
-            if "anthropic" in self.model_config.provider.lower():
-                headers["x-api-key"] = self.model_config.api_key
-                headers["anthropic-version"] = "2023-06-01"
-            else:
-                headers["authorization"] = f"Bearer {self.model_config.api_key}"
+    def _build_url(self, path: str) -> str:
+        """Build the upstream URL for an API path.
 
-        # Add any additional headers
-        if additional_headers:
-            headers.update(additional_headers)
+        Callers use a small set of constant paths, so URLs are cached.
 
-        # Apply header manipulation
-        return self.header_manipulator.process_headers(headers)
+        Args:
+            path: API path
+
+        Returns:
+            Full upstream URL
+        """
+        url = self._urls.get(path)
+        if url is None:
+            url = self._urls[path] = f"{self._endpoint_base}/{path.lstrip('/')}"
+        return url
+
+    async def request(
+        self, path: str, data: Dict[str, Any], stream: bool = False
+    ) -> httpx.Response:
+        """Send a POST request to a provider API path.
+
+        Args:
+            path: API path
+            data: Request data
+            stream: Whether to stream response
+
+        Returns:
+            Response (left open for streaming, see _stream_request)
+        """
+        if stream:
+            return await self._stream_request("POST", path, data)
+        return await self._make_request("POST", path, data)
 
     def _transform_request(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Transform request data.
@@ -120,41 +213,51 @@ class BaseClient:
         Returns:
             HTTP response
         """
-        url = f"{self.model_config.endpoint.rstrip('/')}/{path.lstrip('/')}"
+        url = self._build_url(path)
         prepared_headers = self._prepare_headers(headers)
 
         # Transform request data
-        if data:
+        if data and self._has_transforms:
             data = self._transform_request(data)
 
         # Log request if enabled
-        if self.log_requests and self.request_logger:
+        if self._do_log_req:
             self.request_logger.log_request(method, url, prepared_headers, data)
 
+        # Serialize once so retries resend the same bytes
+        body = orjson.dumps(data) if data is not None else None
+
         async def _request():
             return await self.client.request(
                 method=method,
                 url=url,
-                json=data,
+                content=body,
                 headers=prepared_headers,
+                timeout=self._timeout,
             )
 
+        # Identical concurrent requests can share one upstream call (opt-in)
+        dedupe_key = None
+        if self.model_config.dedupe_requests:
+            dedupe_key = (method, url, body, tuple(prepared_headers.items()))
+
         # Execute with retry
-        response = await self.retry_handler.execute_with_retry(
+        response = await self.retry_handler.execute_response_with_retry(
             _request,
             operation_name=f"{method} {path}",
+            dedupe_key=dedupe_key,
         )
 
-        # Log response if enabled
-        if self.log_responses and self.request_logger:
+        # Log response if enabled (skip parsing when the record would be dropped)
+        if self._do_log_resp and self.request_logger.is_enabled():
             try:
-                response_data = response.json()
-            except Exception:
+                response_data = orjson.loads(response.content)
+            except orjson.JSONDecodeError:
                 response_data = response.text
 
             self.request_logger.log_response(
                 response.status_code,
-                dict(response.headers),
+                response.headers,
                 response_data,
             )
 
@@ -166,42 +269,50 @@ class BaseClient:
         path: str,
         data: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
-    ) -> AsyncIterator[bytes]:
+    ) -> httpx.Response:
         """Make streaming HTTP request.
 
+        The response is returned with its body unread so callers can iterate
+        it directly; they must close it with ``aclose()`` when done.
+
         Args:
             method: HTTP method
             path: API path
             data: Request data
             headers: Additional headers
 
-        Yields:
-            Response chunks
+        Returns:
+            Open HTTP response
         """
-        url = f"{self.model_config.endpoint.rstrip('/')}/{path.lstrip('/')}"
+        url = self._build_url(path)
         prepared_headers = self._prepare_headers(headers)
 
         # Transform request data
-        if data:
+        if data and self._has_transforms:
             data = self._transform_request(data)
 
         # Log request if enabled
-        if self.log_requests and self.request_logger:
+        if self._do_log_req:
             self.request_logger.log_request(method, url, prepared_headers, data)
 
+        request = self.client.build_request(
+            method=method,
+            url=url,
+            content=orjson.dumps(data) if data is not None else None,
+            headers=prepared_headers,
+            timeout=self._timeout,
+        )
+
         try:
-            async with self.client.stream(
-                method=method,
-                url=url,
-                json=data,
-                headers=prepared_headers,
-            ) as response:
+            response = await self.client.send(request, stream=True)
+            try:
                 response.raise_for_status()
-
-                async for chunk in response.aiter_bytes():
-                    yield chunk
-
+            except httpx.HTTPStatusError:
+                await response.aclose()
+                raise
         except Exception as e:
             if self.request_logger:
                 self.request_logger.log_error(e, context="streaming request")
             raise
+
+        return response
@@ -4,7 +4,13 @@ import os
 from typing import Any, Dict, List, Optional
 
 import yaml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
+
+# Use the libyaml-backed loader when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Model names map to environment variable names with dashes as underscores
+_ENV_NAME_TRANS = str.maketrans("-", "_")
 
 
 class RetryConfig(BaseModel):
@@ -24,6 +30,17 @@ class RetryConfig(BaseModel):
     max_delay: float = Field(
         default=60.0, ge=1.0, description="Maximum delay in seconds"
     )
+    jitter: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=1.0,
+        description="Fraction of each delay to randomize (1 = full jitter, 0 disables jitter)",
+    )
+    total_timeout: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Stop retrying once this many seconds have passed since the first attempt",
+    )
 
 
 class ModelConfig(BaseModel):
@@ -45,6 +62,10 @@ class ModelConfig(BaseModel):
         default=None,
         description="Actual model name to send to provider (overrides incoming model name)",
     )
+    dedupe_requests: bool = Field(
+        default=False,
+        description="Share one upstream call between identical concurrent non-streaming requests",
+    )
 
 
 class HeaderRuleConfig(BaseModel):
@@ -106,6 +127,48 @@ class ServerConfig(BaseModel):
     mask_api_keys: bool = Field(
         default=True, description="Mask API keys in logs"
     )
+    stream_chunk_size: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Re-chunk streamed responses to this many bytes (default: pass through as received)",
+    )
+    stream_buffer_chunks: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Read up to this many streamed chunks ahead of slow clients (default: no read-ahead)",
+    )
+    stream_coalesce_bytes: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Merge small streamed chunks until this many bytes are buffered (requires stream_coalesce_ms)",
+    )
+    stream_coalesce_ms: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Send merged streamed chunks after at most this many milliseconds",
+    )
+    log_buffer_size: int = Field(
+        default=0,
+        ge=0,
+        description="Buffer up to this many log records between writes (0 = write immediately)",
+    )
+
+    @model_validator(mode="after")
+    def _check_stream_coalescing(self) -> "ServerConfig":
+        """Require a time bound whenever streamed chunks are merged by size.
+
+        Without one, tokens from a slow model would be held back until the
+        byte threshold is reached or the stream ends.
+
+        Returns:
+            Validated server configuration
+
+        Raises:
+            ValueError: If stream_coalesce_bytes is set without stream_coalesce_ms
+        """
+        if self.stream_coalesce_bytes and not self.stream_coalesce_ms:
+            raise ValueError("stream_coalesce_bytes requires stream_coalesce_ms to be set")
+        return self
 
 
 class AppConfig(BaseModel):
@@ -141,7 +204,7 @@ class AppConfig(BaseModel):
             raise FileNotFoundError(f"Configuration file not found: {path}")
 
         with open(path, "r") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YamlLoader)
 
         # Process environment variable overrides
         data = cls._process_env_overrides(data)
@@ -156,21 +219,27 @@ class AppConfig(BaseModel):
         - LLM_ROUTER_MODEL_{MODEL_NAME}_API_KEY
         - LLM_ROUTER_SERVER_PORT
         """
+        env = os.environ
+
         # Override model API keys from environment
         if "models" in data:
             for model_name, model_config in data["models"].items():
-                env_key = f"LLM_ROUTER_MODEL_{model_name.upper().replace('-', '_')}_API_KEY"
-                if env_value := os.getenv(env_key):
+                env_key = (
+                    "LLM_ROUTER_MODEL_"
+                    + model_name.translate(_ENV_NAME_TRANS).upper()
+                    + "_API_KEY"
+                )
+                if env_value := env.get(env_key):
                     model_config["api_key"] = env_value
 
         # Override server settings
         if "server" not in data:
             data["server"] = {}
 
-        if env_port := os.getenv("LLM_ROUTER_SERVER_PORT"):
+        if env_port := env.get("LLM_ROUTER_SERVER_PORT"):
             data["server"]["port"] = int(env_port)
 
-        if env_host := os.getenv("LLM_ROUTER_SERVER_HOST"):
+        if env_host := env.get("LLM_ROUTER_SERVER_HOST"):
             data["server"]["host"] = env_host
 
         return data
@@ -1,17 +1,22 @@
 """Main FastAPI application for LLM Router Service."""
 
+import asyncio
 import logging
 import sys
 from contextlib import asynccontextmanager
+from functools import partial
+from logging.handlers import MemoryHandler
 from pathlib import Path
+from typing import List, Optional
 
 import uvicorn
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 
+from .clients.base import create_http_client
 from .config import AppConfig
 from .middleware.headers import HeaderManipulator
-from .middleware.logging import RequestLogger
+from .middleware.logging import RequestLogger, buffer_log_handlers, unbuffer_log_handlers
 from .middleware.transform import ContentTransformer
 from .routers import anthropic, openai
 
@@ -24,6 +29,21 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Seconds between flushes of buffered log records
+LOG_FLUSH_INTERVAL = 1.0
+
+
+async def _flush_logs_periodically(buffers: List[MemoryHandler]) -> None:
+    """Flush buffered log records at a fixed interval.
+
+    Args:
+        buffers: Buffering handlers to flush
+    """
+    while True:
+        await asyncio.sleep(LOG_FLUSH_INTERVAL)
+        for buffer in buffers:
+            buffer.flush()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -37,31 +57,58 @@ async def lifespan(app: FastAPI):
     logger.info(f"Loaded {len(app.state.config.models)} model(s)")
     logger.info(f"Loaded {len(app.state.config.transformations)} transformation(s)")
 
+    # One pooled HTTP client per SSL verification mode, shared by all models
+    app.state.http_clients = {
+        ssl_verify: create_http_client(ssl_verify)
+        for ssl_verify in {m.ssl_verify for m in app.state.config.models.values()}
+    }
+
+    # Batch log writes if configured
+    log_buffers = []
+    flush_task = None
+    log_buffer_size = app.state.config.server.log_buffer_size
+    if log_buffer_size:
+        log_buffers = buffer_log_handlers(logging.getLogger(), log_buffer_size)
+        flush_task = asyncio.create_task(_flush_logs_periodically(log_buffers))
+
     yield
 
     # Shutdown
     logger.info("Shutting down LLM Router Service...")
+    for http_client in app.state.http_clients.values():
+        await http_client.aclose()
+
+    if flush_task:
+        flush_task.cancel()
+        unbuffer_log_handlers(logging.getLogger(), log_buffers)
 
 
-def create_app(config_path: str = "config.yaml") -> FastAPI:
+def create_app(
+    config_path: str = "config.yaml",
+    preloaded_config: Optional[AppConfig] = None,
+) -> FastAPI:
     """Create FastAPI application.
 
     Args:
         config_path: Path to configuration file
+        preloaded_config: Already loaded configuration (skips reading config_path)
 
     Returns:
         FastAPI application
     """
     # Load configuration
-    try:
-        config = AppConfig.from_yaml(config_path)
-    except FileNotFoundError:
-        logger.error(f"Configuration file not found: {config_path}")
-        logger.info("Please create a configuration file. See config.example.yaml for reference.")
-        sys.exit(1)
-    except Exception as e:
-        logger.error(f"Failed to load configuration: {e}")
-        sys.exit(1)
+    if preloaded_config is not None:
+        config = preloaded_config
+    else:
+        try:
+            config = AppConfig.from_yaml(config_path)
+        except FileNotFoundError:
+            logger.error(f"Configuration file not found: {config_path}")
+            logger.info("Please create a configuration file. See config.example.yaml for reference.")
+            sys.exit(1)
+        except Exception as e:
+            logger.error(f"Failed to load configuration: {e}")
+            sys.exit(1)
 
     # Create FastAPI app
     app = FastAPI(
@@ -76,6 +123,7 @@ def create_app(config_path: str = "config.yaml") -> FastAPI:
     app.state.header_manipulator = HeaderManipulator(config.header_rules)
     app.state.content_transformer = ContentTransformer(config.transformations)
     app.state.request_logger = RequestLogger(mask_api_keys=config.server.mask_api_keys)
+    app.state.clients = {}  # (client class, model name) -> provider client
 
     # Register routers
     app.include_router(openai.router)
@@ -154,9 +202,15 @@ def cli():
 
     logger.info(f"Starting server on {host}:{port}")
 
-    # Run server
+    if args.reload:
+        # Reload needs an import string, so the worker loads the config itself
+        app = "llm_router.main:create_app"
+    else:
+        app = partial(create_app, preloaded_config=config)
+
+    # Run server (uvicorn selects uvloop and httptools automatically when installed)
     uvicorn.run(
-        "llm_router.main:create_app",
+        app,
         host=host,
         port=port,
         reload=args.reload,
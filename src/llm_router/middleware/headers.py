@@ -2,12 +2,17 @@
 
 import logging
 import re
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from ..config import HeaderRuleConfig
 
 logger = logging.getLogger(__name__)
 
+# Drop patterns that change meaning inside a combined alternation: global
+# inline flags must start the whole expression, and group references would
+# point at other patterns' groups once groups are renumbered
+_UNCOMBINABLE_PATTERN = re.compile(r"\(\?[aiLmsux]+\)|\\\d|\(\?P=|\(\?\(")
+
 
 class HeaderManipulator:
     """Handles header manipulation for requests."""
@@ -19,38 +24,66 @@ class HeaderManipulator:
             config: Header rule configuration
         """
         self.config = config
-        # Pre-compile regex patterns for drop_headers
-        self._compiled_drop_patterns: List[re.Pattern] = []
         self._exact_drop_headers: set = set()
-
+        self._add_items = tuple(config.add_headers.items())
+        self._force_items = tuple(config.force_headers.items())
+        # With no rules configured, headers pass through untouched
+        self._noop = not (
+            config.drop_all
+            or config.drop_headers
+            or config.add_headers
+            or config.force_headers
+        )
+
+        combined_patterns: List[str] = []
+        self._drop_patterns: List[re.Pattern] = []
         for pattern in config.drop_headers:
             # Check if it's a regex pattern (contains regex special chars)
             if any(char in pattern for char in r'.*+?[]{}()^$|\\'):
                 try:
-                    self._compiled_drop_patterns.append(
-                        re.compile(pattern, re.IGNORECASE)
-                    )
+                    compiled = re.compile(pattern, re.IGNORECASE)
                 except re.error as e:
                     logger.warning(f"Invalid regex pattern '{pattern}': {e}")
+                    continue
+                if _UNCOMBINABLE_PATTERN.search(pattern):
+                    self._drop_patterns.append(compiled)
+                else:
+                    combined_patterns.append(pattern)
             else:
                 # Exact match (case-insensitive)
                 self._exact_drop_headers.add(pattern.lower())
 
+        # Combine regex patterns into one alternation so each header needs a
+        # single match call regardless of the number of rules
+        self._drop_pattern: Optional[re.Pattern] = None
+        if combined_patterns:
+            try:
+                self._drop_pattern = re.compile(
+                    "|".join(f"(?:{p})" for p in combined_patterns), re.IGNORECASE
+                )
+            except re.error:
+                # Patterns that only compile on their own are matched one by one
+                self._drop_patterns.extend(
+                    re.compile(p, re.IGNORECASE) for p in combined_patterns
+                )
+
     def _should_drop_header(self, header_name: str) -> bool:
         """Check if header should be dropped.
 
         Args:
-            header_name: Header name to check
+            header_name: Lower-cased header name to check
 
         Returns:
             True if header should be dropped
         """
         # Check exact matches
-        if header_name.lower() in self._exact_drop_headers:
+        if header_name in self._exact_drop_headers:
             return True
 
         # Check regex patterns
-        for pattern in self._compiled_drop_patterns:
+        if self._drop_pattern is not None and self._drop_pattern.match(header_name):
+            return True
+        for pattern in self._drop_patterns:
             if pattern.match(header_name):
                 return True
 
@@ -63,30 +96,25 @@ class HeaderManipulator:
             headers: Original headers
 
         Returns:
-            Processed headers
+            Processed headers (the input itself if no rules are configured)
         """
+        if self._noop:
+            return headers
+
         if self.config.drop_all:
             # Start with empty dict, only use configured headers
             result = {}
         else:
-            # Start with original headers
-            result = dict(headers)
-
-            # Drop specified headers (supports regex)
-            result = {
-                k: v
-                for k, v in result.items()
-                if not self._should_drop_header(k)
-            }
+            # Copy original headers, dropping specified ones (supports regex)
+            should_drop = self._should_drop_header
+            result = {k: v for k, v in headers.items() if not should_drop(k.lower())}
 
         # Add new headers (don't override if exists)
-        for key, value in self.config.add_headers.items():
-            if key not in result:
-                result[key] = value
+        for key, value in self._add_items:
+            result.setdefault(key, value)
 
         # Force headers (override if exists)
-        for key, value in self.config.force_headers.items():
-            result[key] = value
+        result.update(self._force_items)
 
         logger.debug(f"Processed headers: {len(headers)} -> {len(result)}")
         return result
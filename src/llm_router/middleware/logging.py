@@ -1,16 +1,74 @@
 """Request and response logging middleware."""
 
-import json
 import logging
+import logging.handlers
 import re
-from typing import Any, Dict
+from typing import Any, Dict, List, Mapping
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
 
+def _dumps_indented(data: Any) -> str:
+    """Serialize log data as indented JSON.
+
+    Args:
+        data: Data to serialize
+
+    Returns:
+        JSON string
+    """
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+
+
+def buffer_log_handlers(
+    target: logging.Logger, capacity: int
+) -> List[logging.handlers.MemoryHandler]:
+    """Wrap a logger's handlers so records are written in batches.
+
+    Buffered records are written once ``capacity`` records are queued or an
+    ERROR record arrives; callers should also flush periodically so quiet
+    periods do not hold records back.
+
+    Args:
+        target: Logger whose handlers are wrapped
+        capacity: Number of records to buffer per handler
+
+    Returns:
+        Buffering handlers now attached to the logger
+    """
+    buffers = []
+    for handler in list(target.handlers):
+        buffer = logging.handlers.MemoryHandler(
+            capacity, flushLevel=logging.ERROR, target=handler, flushOnClose=True
+        )
+        target.removeHandler(handler)
+        target.addHandler(buffer)
+        buffers.append(buffer)
+    return buffers
+
+
+def unbuffer_log_handlers(
+    target: logging.Logger, buffers: List[logging.handlers.MemoryHandler]
+) -> None:
+    """Flush buffered records and restore the original handlers.
+
+    Args:
+        target: Logger passed to buffer_log_handlers
+        buffers: Handlers returned by buffer_log_handlers
+    """
+    for buffer in buffers:
+        target.removeHandler(buffer)
+        target.addHandler(buffer.target)
+        buffer.close()
+
+
 class RequestLogger:
     """Handles request and response logging with sensitive data masking."""
 
+    _SENSITIVE_HEADERS = frozenset({"authorization", "x-api-key", "api-key", "apikey"})
+
     def __init__(self, mask_api_keys: bool = True):
         """Initialize request logger.
 
@@ -18,10 +76,17 @@ class RequestLogger:
             mask_api_keys: Whether to mask API keys in logs
         """
         self.mask_api_keys = mask_api_keys
-        self._api_key_pattern = re.compile(
-            r"(sk-[a-zA-Z0-9]{20,}|sk-ant-[a-zA-Z0-9-]{20,})",
-            re.IGNORECASE,
-        )
+        self._api_key_pattern = re.compile(r"sk-(?:ant-)?[A-Za-z0-9-]{20,}")
+        # Same pattern for serialized JSON bodies, masked before decoding
+        self._api_key_pattern_bytes = re.compile(rb"sk-(?:ant-)?[A-Za-z0-9-]{20,}")
+
+    def is_enabled(self) -> bool:
+        """Check whether request/response records would be emitted.
+
+        Returns:
+            True if the logger is enabled for INFO records
+        """
+        return logger.isEnabledFor(logging.INFO)
 
     def mask_sensitive_data(self, text: str) -> str:
         """Mask sensitive data in text.
@@ -32,7 +97,9 @@ class RequestLogger:
         Returns:
             Masked text
         """
-        if not self.mask_api_keys:
+        # Every key format starts with "sk-"; a substring check is much
+        # cheaper than scanning large bodies with the regex
+        if not self.mask_api_keys or "sk-" not in text:
             return text
 
         # Mask API keys
@@ -40,7 +107,7 @@ class RequestLogger:
 
         return text
 
-    def mask_headers(self, headers: Dict[str, str]) -> Dict[str, str]:
+    def mask_headers(self, headers: Mapping[str, str]) -> Dict[str, str]:
         """Mask sensitive headers.
 
         Args:
@@ -50,22 +117,49 @@ class RequestLogger:
             Headers with masked values
         """
         if not self.mask_api_keys:
-            return headers
+            return dict(headers)
+
+        sensitive = self._SENSITIVE_HEADERS
+        return {
+            key: self._mask_value(value) if key.lower() in sensitive else value
+            for key, value in headers.items()
+        }
+
+    def _format_body(self, body: Any) -> str:
+        """Serialize a request or response body for logging.
+
+        JSON bodies are probed and masked while still encoded, so each body
+        is decoded exactly once.
 
-        masked = {}
-        sensitive_headers = {"authorization", "x-api-key", "api-key", "apikey"}
+        Args:
+            body: Request or response body
 
-        for key, value in headers.items():
-            if key.lower() in sensitive_headers:
-                # Mask the value
-                if len(value) > 12:
-                    masked[key] = value[:8] + "..." + value[-4:]
-                else:
-                    masked[key] = "***"
-            else:
-                masked[key] = value
+        Returns:
+            Body text with API keys masked
+        """
+        if not isinstance(body, (dict, list)):
+            return self.mask_sensitive_data(str(body))
 
-        return masked
+        body_bytes = orjson.dumps(body)
+        if self.mask_api_keys and b"sk-" in body_bytes:
+            body_bytes = self._api_key_pattern_bytes.sub(
+                lambda m: m.group(0)[:8] + b"..." + m.group(0)[-4:], body_bytes
+            )
+        return body_bytes.decode()
+
+    @staticmethod
+    def _mask_value(value: str) -> str:
+        """Mask a sensitive header value.
+
+        Args:
+            value: Header value
+
+        Returns:
+            Masked value
+        """
+        if len(value) > 12:
+            return value[:8] + "..." + value[-4:]
+        return "***"
 
     def log_request(
         self,
@@ -82,6 +176,10 @@ class RequestLogger:
             headers: Request headers
             body: Request body
         """
+        # Skip masking and serialization if the record would be dropped
+        if not self.is_enabled():
+            return
+
         masked_headers = self.mask_headers(headers)
 
         log_data = {
@@ -92,19 +190,14 @@ class RequestLogger:
         }
 
         if body is not None:
-            if isinstance(body, (dict, list)):
-                body_str = json.dumps(body)
-            else:
-                body_str = str(body)
+            log_data["body"] = self._format_body(body)
 
-            log_data["body"] = self.mask_sensitive_data(body_str)
-
-        logger.info(f"Request: {json.dumps(log_data, indent=2)}")
+        logger.info(f"Request: {_dumps_indented(log_data)}")
 
     def log_response(
         self,
         status_code: int,
-        headers: Dict[str, str],
+        headers: Mapping[str, str],
         body: Any = None,
     ) -> None:
         """Log incoming response.
@@ -114,6 +207,9 @@ class RequestLogger:
             headers: Response headers
             body: Response body
         """
+        if not self.is_enabled():
+            return
+
         masked_headers = self.mask_headers(headers)
 
         log_data = {
@@ -123,14 +219,9 @@ class RequestLogger:
         }
 
         if body is not None:
-            if isinstance(body, (dict, list)):
-                body_str = json.dumps(body)
-            else:
-                body_str = str(body)
-
-            log_data["body"] = self.mask_sensitive_data(body_str)
+            log_data["body"] = self._format_body(body)
 
-        logger.info(f"Response: {json.dumps(log_data, indent=2)}")
+        logger.info(f"Response: {_dumps_indented(log_data)}")
 
     def log_error(
         self,
@@ -1,16 +1,92 @@
 """Content transformation middleware for request/response manipulation."""
 
-import json
+import copy
 import logging
 import re
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Sequence, Tuple
 
 from jsonpath_ng import parse as jsonpath_parse
+from jsonpath_ng.jsonpath import Child, Fields, Index, Root, This
 
 from ..config import TransformationConfig
 
 logger = logging.getLogger(__name__)
 
+# Pipeline step: (name for error messages, handler, handler argument)
+_Step = Tuple[str, Callable[[Dict[str, Any], Any], Dict[str, Any]], Any]
+
+
+class _RegexStepError(Exception):
+    """Raised when one pattern of a merged regex replace run fails."""
+
+    def __init__(self, config: TransformationConfig):
+        super().__init__(config.name)
+        self.config = config
+
+
+def _path_keys(path: Any) -> Tuple[Any, ...]:
+    """Flatten a jsonpath-ng match path into dict keys and list indices.
+
+    Args:
+        path: ``full_path`` of a jsonpath-ng match
+
+    Returns:
+        Keys from the root to the matched element
+
+    Raises:
+        ValueError: If the path contains an unsupported element
+    """
+    if isinstance(path, Child):
+        return _path_keys(path.left) + _path_keys(path.right)
+    if isinstance(path, Fields):
+        return tuple(path.fields)
+    if isinstance(path, Index):
+        # jsonpath-ng >= 1.8 stores a tuple of indices, older releases one index
+        indices = getattr(path, "indices", None)
+        return tuple(indices) if indices is not None else (path.index,)
+    if isinstance(path, (Root, This)):
+        return ()
+    raise ValueError(f"Unsupported JSON path element: {path!r}")
+
+
+def _walk_strings(obj: Any, fn: Callable[[str], str]) -> Any:
+    """Apply a function to every string value in a JSON-like tree.
+
+    Containers are copied only when something inside them changed, so
+    untouched branches are shared with the input.
+
+    Args:
+        obj: Dict, list, or scalar to walk
+        fn: Function applied to each string value
+
+    Returns:
+        Transformed tree (the input object itself if nothing changed)
+    """
+    if isinstance(obj, str):
+        return fn(obj)
+
+    if isinstance(obj, dict):
+        result = None
+        for key, value in obj.items():
+            new_value = _walk_strings(value, fn)
+            if new_value is not value:
+                if result is None:
+                    result = obj.copy()
+                result[key] = new_value
+        return obj if result is None else result
+
+    if isinstance(obj, list):
+        result = None
+        for i, value in enumerate(obj):
+            new_value = _walk_strings(value, fn)
+            if new_value is not value:
+                if result is None:
+                    result = obj.copy()
+                result[i] = new_value
+        return obj if result is None else result
+
+    return obj
+
 
 class ContentTransformer:
     """Handles content transformation for requests and responses."""
@@ -23,11 +99,30 @@ class ContentTransformer:
         """
         self.transformations = [t for t in transformations if t.enabled]
         self._compile_patterns()
+        self._pipeline = self._build_pipeline()
+        self._has_enabled = bool(self._pipeline)
+
+    def has_enabled_transforms(self) -> bool:
+        """Check whether any transformation is enabled.
+
+        Returns:
+            True if transform_request may change the data
+        """
+        return self._has_enabled
 
     def _compile_patterns(self) -> None:
-        """Pre-compile regex patterns for performance."""
+        """Pre-compile regex patterns and JSON paths for performance."""
         for transformation in self.transformations:
-            if transformation.type == "regex_replace" and transformation.pattern:
+            if transformation.type == "jsonpath_drop" and transformation.path:
+                try:
+                    transformation._compiled_jsonpath = jsonpath_parse(transformation.path)
+                except Exception as e:
+                    logger.error(f"Invalid JSON path '{transformation.path}': {e}")
+            elif transformation.type == "jsonpath_add" and transformation.path:
+                transformation._path_parts = tuple(
+                    transformation.path.replace("$.", "").split(".")
+                )
+            elif transformation.type == "regex_replace" and transformation.pattern:
                 flags = 0
                 if transformation.flags:
                     flag_map = {
@@ -42,62 +137,137 @@ class ContentTransformer:
                     transformation.pattern, flags
                 )
 
+    def _build_pipeline(self) -> List[_Step]:
+        """Resolve each transformation to its handler once.
+
+        Unknown transformation types are reported here and left out of the
+        pipeline rather than being re-checked on every request. Consecutive
+        regex replacements are merged into one step so the request tree is
+        walked once for the whole run.
+
+        Returns:
+            Pipeline steps in configuration order
+        """
+        handlers = {
+            "jsonpath_drop": self._apply_jsonpath_drop,
+            "jsonpath_add": self._apply_jsonpath_add,
+        }
+
+        pipeline: List[_Step] = []
+        regex_run: List[TransformationConfig] = []
+
+        def flush_regex_run() -> None:
+            if regex_run:
+                name = ", ".join(t.name for t in regex_run)
+                pipeline.append((name, self._apply_regex_replace, tuple(regex_run)))
+                regex_run.clear()
+
+        for transformation in self.transformations:
+            if transformation.type == "regex_replace":
+                if hasattr(transformation, "_compiled_pattern"):
+                    regex_run.append(transformation)
+                else:
+                    logger.warning(f"Pattern not compiled for {transformation.name}")
+                continue
+
+            flush_regex_run()
+            handler = handlers.get(transformation.type)
+            if handler is None:
+                logger.warning(f"Unknown transformation type: {transformation.type}")
+                continue
+            pipeline.append((transformation.name, handler, transformation))
+
+        flush_regex_run()
+        return pipeline
+
     def transform_request(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Apply transformations to request data.
 
+        Handlers never mutate their input, so the caller's data is left
+        untouched.
+
         Args:
             data: Request data
 
         Returns:
             Transformed request data
         """
-        result = data.copy()
+        if not self._has_enabled:
+            return data
 
-        for transformation in self.transformations:
+        result = data
+        for name, handler, arg in self._pipeline:
             try:
-                if transformation.type == "regex_replace":
-                    result = self._apply_regex_replace(result, transformation)
-                elif transformation.type == "jsonpath_drop":
-                    result = self._apply_jsonpath_drop(result, transformation)
-                elif transformation.type == "jsonpath_add":
-                    result = self._apply_jsonpath_add(result, transformation)
-                else:
-                    logger.warning(f"Unknown transformation type: {transformation.type}")
+                result = handler(result, arg)
             except Exception as e:
                 logger.error(
-                    f"Error applying transformation '{transformation.name}': {e}",
+                    f"Error applying transformation '{name}': {e}",
                     exc_info=True,
                 )
 
         return result
 
     def _apply_regex_replace(
-        self, data: Dict[str, Any], config: TransformationConfig
+        self, data: Dict[str, Any], configs: Sequence[TransformationConfig]
     ) -> Dict[str, Any]:
-        """Apply regex replace transformation.
+        """Apply a run of regex replace transformations.
+
+        Each string value goes through every pattern in order, which gives
+        the same result as applying the transformations one at a time. A
+        transformation that fails is logged and left out, and the run is
+        reapplied without it, so it does not discard the others.
 
         Args:
             data: Data to transform
-            config: Transformation configuration
+            configs: Consecutive regex replace configurations
 
         Returns:
             Transformed data
         """
-        if not hasattr(config, "_compiled_pattern"):
-            logger.warning(f"Pattern not compiled for {config.name}")
-            return data
+        active = list(configs)
+        while active:
+            try:
+                return self._replace_strings(data, active)
+            except _RegexStepError as e:
+                logger.error(
+                    f"Error applying transformation '{e.config.name}': {e.__cause__}",
+                    exc_info=e.__cause__,
+                )
+                active.remove(e.config)
+        return data
+
+    @staticmethod
+    def _replace_strings(
+        data: Dict[str, Any], configs: Sequence[TransformationConfig]
+    ) -> Dict[str, Any]:
+        """Run regex replacements over every string value in one walk.
+
+        Args:
+            data: Data to transform
+            configs: Regex replace configurations, applied in order
+
+        Returns:
+            Transformed data
 
-        # Convert to JSON string, apply regex, convert back
-        json_str = json.dumps(data)
-        transformed_str = config._compiled_pattern.sub(
-            config.replacement or "", json_str
+        Raises:
+            _RegexStepError: If a pattern fails, naming its configuration
+        """
+        # Only string values are rewritten, so keys and JSON structure are
+        # never affected by the patterns
+        steps = tuple(
+            (config, config._compiled_pattern.sub, config.replacement or "")
+            for config in configs
         )
 
-        try:
-            return json.loads(transformed_str)
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON after regex replace: {e}")
-            return data
+        def replace_all(text: str) -> str:
+            for config, sub, replacement in steps:
+                try:
+                    text = sub(replacement, text)
+                except Exception as e:
+                    raise _RegexStepError(config) from e
+            return text
+
+        return _walk_strings(data, replace_all)
 
     def _apply_jsonpath_drop(
         self, data: Dict[str, Any], config: TransformationConfig
@@ -114,48 +284,53 @@ class ContentTransformer:
         if not config.path:
             return data
 
+        if not hasattr(config, "_compiled_jsonpath"):
+            logger.warning(f"JSON path not compiled for {config.name}")
+            return data
+
         try:
-            jsonpath_expr = jsonpath_parse(config.path)
-            matches = jsonpath_expr.find(data)
+            matches = config._compiled_jsonpath.find(data)
 
             if not matches:
                 logger.debug(f"No matches found for path: {config.path}")
                 return data
 
-            # Work with a copy
-            result = json.loads(json.dumps(data))
-
-            # Sort matches by path depth (deepest first) to avoid index issues
-            matches = sorted(matches, key=lambda m: len(str(m.full_path)), reverse=True)
-
-            for match in matches:
-                # Get parent and remove the matched element
-                path_parts = str(match.full_path).split(".")
-
-                if len(path_parts) == 1:
-                    # Top-level key
-                    if path_parts[0] in result:
-                        del result[path_parts[0]]
+            # Delete deepest paths first, and higher list indices before lower
+            # ones under the same parent, so earlier pops don't shift later paths
+            paths = sorted(
+                (_path_keys(match.full_path) for match in matches),
+                key=lambda keys: (len(keys), keys),
+                reverse=True,
+            )
+
+            # Copy only the containers along matched paths; the rest of the
+            # tree is shared with the input
+            result = copy.copy(data)
+            copied = {id(result)}
+
+            for keys in paths:
+                if not keys:
+                    continue
+
+                parent = result
+                for key in keys[:-1]:
+                    try:
+                        child = parent[key]
+                    except (KeyError, IndexError, TypeError):
+                        break
+                    if not isinstance(child, (dict, list)):
+                        break
+                    if id(child) not in copied:
+                        child = parent[key] = copy.copy(child)
+                        copied.add(id(child))
+                    parent = child
                 else:
-                    # Nested key
-                    parent = result
-                    for part in path_parts[:-1]:
-                        # Handle array indices
-                        if part.startswith("[") and part.endswith("]"):
-                            idx = int(part[1:-1])
-                            parent = parent[idx]
-                        else:
-                            parent = parent.get(part, {})
-
-                    last_part = path_parts[-1]
-                    if isinstance(parent, dict) and last_part in parent:
-                        del parent[last_part]
-                    elif isinstance(parent, list):
-                        # Handle list index
-                        if last_part.startswith("[") and last_part.endswith("]"):
-                            idx = int(last_part[1:-1])
-                            if 0 <= idx < len(parent):
-                                parent.pop(idx)
+                    last_key = keys[-1]
+                    if isinstance(parent, dict):
+                        parent.pop(last_key, None)
+                    elif isinstance(parent, list) and isinstance(last_key, int):
+                        if 0 <= last_key < len(parent):
+                            parent.pop(last_key)
 
             logger.debug(f"Dropped {len(matches)} matches for path: {config.path}")
             return result
@@ -180,18 +355,18 @@ class ContentTransformer:
             return data
 
         try:
-            # Work with a copy
-            result = json.loads(json.dumps(data))
+            path_parts = config._path_parts
 
-            # Parse the path
-            path_parts = config.path.replace("$.", "").split(".")
-
-            # Navigate to the parent and set the value
+            # Navigate to the parent and set the value, copying only the
+            # containers along the path (other branches are shared)
+            result = copy.copy(data)
             current = result
-            for i, part in enumerate(path_parts[:-1]):
+            for part in path_parts[:-1]:
                 if part not in current:
                     # Create intermediate objects
                     current[part] = {}
+                else:
+                    current[part] = copy.copy(current[part])
                 current = current[part]
 
             # Set the value
@@ -1,5 +1,6 @@
 """Data models for LLM Router Service."""
 
+from functools import lru_cache
 from typing import Any, Dict, List, Literal, Optional, Union
 
 from pydantic import BaseModel, Field
@@ -159,6 +160,28 @@ class ErrorResponse(BaseModel):
         )
 
 
+@lru_cache(maxsize=128)
+def error_detail(error_type: str, message: str, status_code: int = 500) -> Dict[str, Any]:
+    """Build the serialized ErrorResponse for an error.
+
+    Repeated failures usually carry the same message, so results are cached;
+    the returned dict is shared and must not be mutated.
+
+    Args:
+        error_type: Type of error
+        message: Error message
+        status_code: HTTP status code
+
+    Returns:
+        ErrorResponse as a dict
+    """
+    return ErrorResponse.from_exception(
+        error_type=error_type,
+        message=message,
+        status_code=status_code,
+    ).model_dump()
+
+
 # Streaming Models
 class StreamChunk(BaseModel):
     """Generic streaming chunk."""
@@ -172,9 +195,6 @@ class StreamChunk(BaseModel):
         Returns:
             SSE formatted string
         """
-        lines = []
         if self.event:
-            lines.append(f"event: {self.event}")
-        lines.append(f"data: {self.data}")
-        lines.append("")
-        return "\n".join(lines)
+            return f"event: {self.event}\ndata: {self.data}\n"
+        return f"data: {self.data}\n"
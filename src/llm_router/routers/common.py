@@ -0,0 +1,159 @@
+"""Helpers shared by the API routers."""
+
+import logging
+from typing import Awaitable, Callable, Tuple, Type, TypeVar
+
+import httpx
+from fastapi import HTTPException, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel
+from starlette.background import BackgroundTask
+
+from ..clients.base import BaseClient
+from ..config import ModelConfig
+from ..models import error_detail
+from ..utils.streaming import stream_response
+
+logger = logging.getLogger(__name__)
+
+ClientT = TypeVar("ClientT", bound=BaseClient)
+
+# Resolves the client and configuration for a model name (router specific)
+ClientGetter = Callable[[Request, str], Awaitable[Tuple[BaseClient, ModelConfig]]]
+
+# Headers for streamed (server-sent events) responses
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+}
+
+
+def get_cached_client(
+    request: Request,
+    client_cls: Type[ClientT],
+    model_name: str,
+    model_config: ModelConfig,
+) -> ClientT:
+    """Get the long-lived client for a model, creating it on first use.
+
+    Clients hold no per-request state, so one instance per model and client
+    class is kept for the application's lifetime.
+
+    Args:
+        request: FastAPI request
+        client_cls: Provider client class
+        model_name: Name of the model
+        model_config: Model configuration
+
+    Returns:
+        Client instance
+    """
+    state = request.app.state
+    key = (client_cls, model_name)
+
+    client = state.clients.get(key)
+    if client is None:
+        app_config = state.config
+        client = state.clients[key] = client_cls(
+            model_config=model_config,
+            retry_config=app_config.get_retry_config(model_name),
+            header_manipulator=state.header_manipulator,
+            content_transformer=state.content_transformer,
+            http_client=state.http_clients[model_config.ssl_verify],
+            request_logger=state.request_logger,
+            log_requests=app_config.server.log_requests,
+            log_responses=app_config.server.log_responses,
+            stream_chunk_size=app_config.server.stream_chunk_size,
+        )
+    return client
+
+
+def passthrough_response(response: httpx.Response) -> Response:
+    """Relay an upstream JSON body without re-encoding it.
+
+    Parsing the body only for FastAPI to serialize it again is skipped. As
+    before, the response is sent with status 200. Bodies not labelled as
+    JSON are still parsed, so a body that is not JSON fails the request the
+    same way it used to.
+
+    Args:
+        response: Completed upstream response
+
+    Returns:
+        JSON response with the upstream body
+    """
+    if "json" not in response.headers.get("content-type", ""):
+        return JSONResponse(response.json())
+    return Response(content=response.content, media_type="application/json")
+
+
+async def proxy_request(
+    request: Request,
+    req_data: BaseModel,
+    get_client: ClientGetter,
+    route: str,
+    provider: str,
+    operation_name: str,
+) -> Response:
+    """Forward a validated API request to the model's provider.
+
+    Args:
+        request: FastAPI request
+        req_data: Validated request body (with ``model`` and ``stream`` fields)
+        get_client: Router function resolving the client for the model
+        route: Client endpoint name (key of the client's ROUTES)
+        provider: Provider name for stream logging
+        operation_name: Endpoint name for error logging
+
+    Returns:
+        Upstream response or streaming response
+
+    Raises:
+        HTTPException: Raised by get_client, or 500 for any other error
+    """
+    try:
+        client, model_config = await get_client(request, req_data.model)
+
+        # Convert request to dict
+        data = req_data.model_dump(exclude_none=True)
+
+        # Check for actual_model_name override
+        if model_config.actual_model_name:
+            # Override the model name in the request
+            data["model"] = model_config.actual_model_name
+
+        path = client.ROUTES[route]
+
+        if req_data.stream:
+            # Streaming response
+            response = await client.request(path, data, stream=True)
+            server_config = request.app.state.config.server
+
+            return StreamingResponse(
+                stream_response(
+                    response.aiter_bytes(client.stream_chunk_size),
+                    provider=provider,
+                    max_buffered_chunks=server_config.stream_buffer_chunks,
+                    coalesce_bytes=server_config.stream_coalesce_bytes,
+                    coalesce_ms=server_config.stream_coalesce_ms,
+                ),
+                media_type="text/event-stream",
+                headers=SSE_HEADERS,
+                background=BackgroundTask(response.aclose),
+            )
+
+        # Non-streaming response
+        response = await client.request(path, data, stream=False)
+        return passthrough_response(response)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error in {operation_name}: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail=error_detail(
+                error_type="internal_error",
+                message=str(e),
+            ),
+        )
@@ -1,26 +1,21 @@
 """OpenAI-compatible API router."""
 
-import logging
-from typing import Any, Dict
+from typing import Tuple
 
 from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import StreamingResponse
 
 from ..clients.openai import OpenAIClient
 from ..clients.ollama import OllamaClient
-from ..models import (
-    ErrorResponse,
-    OpenAIChatCompletionRequest,
-    OpenAICompletionRequest,
-)
-from ..utils.streaming import stream_response
-
-logger = logging.getLogger(__name__)
+from ..config import ModelConfig
+from ..models import OpenAIChatCompletionRequest, OpenAICompletionRequest
+from .common import get_cached_client, proxy_request
 
 router = APIRouter(prefix="/v1", tags=["openai"])
 
 
-async def get_client_for_model(request: Request, model_name: str) -> OpenAIClient | OllamaClient:
+async def get_client_for_model(
+    request: Request, model_name: str
+) -> Tuple[OpenAIClient | OllamaClient, ModelConfig]:
     """Get appropriate client for model.
 
     Args:
@@ -28,7 +23,7 @@ async def get_client_for_model(request: Request, model_name: str) -> OpenAIClien
         model_name: Name of the model
 
     Returns:
-        Client instance
+        Tuple of client instance and model configuration
 
     Raises:
         HTTPException: If model not found or configuration error
@@ -42,34 +37,11 @@ async def get_client_for_model(request: Request, model_name: str) -> OpenAIClien
             detail=f"Model '{model_name}' not found in configuration",
         )
 
-    retry_config = app_config.get_retry_config(model_name)
-
-    # Get middleware components
-    header_manipulator = request.app.state.header_manipulator
-    content_transformer = request.app.state.content_transformer
-    request_logger = request.app.state.request_logger
-
     # Create appropriate client based on provider
-    if model_config.provider.lower() == "ollama":
-        return OllamaClient(
-            model_config=model_config,
-            retry_config=retry_config,
-            header_manipulator=header_manipulator,
-            content_transformer=content_transformer,
-            request_logger=request_logger,
-            log_requests=app_config.server.log_requests,
-            log_responses=app_config.server.log_responses,
-        )
-    else:
-        return OpenAIClient(
-            model_config=model_config,
-            retry_config=retry_config,
-            header_manipulator=header_manipulator,
-            content_transformer=content_transformer,
-            request_logger=request_logger,
-            log_requests=app_config.server.log_requests,
-            log_responses=app_config.server.log_responses,
-        )
+    client_cls = OllamaClient if model_config.provider.lower() == "ollama" else OpenAIClient
+    client = get_cached_client(request, client_cls, model_name, model_config)
+
+    return client, model_config
 
 
 @router.post("/chat/completions")
@@ -86,57 +58,14 @@ async def chat_completions(
     Returns:
         Chat completion response or streaming response
     """
-    try:
-        client = await get_client_for_model(request, req_data.model)
-
-        # Convert request to dict
-        data = req_data.model_dump(exclude_none=True)
-
-        # Get model config to check for actual_model_name override
-        app_config = request.app.state.config
-        model_config = app_config.get_model_config(req_data.model)
-        if model_config and model_config.actual_model_name:
-            # Override the model name in the request
-            data["model"] = model_config.actual_model_name
-
-        if req_data.stream:
-            # Streaming response
-            response_iter = await client.chat_completion(data, stream=True)
-
-            async def generate():
-                try:
-                    async for chunk in stream_response(response_iter, provider="openai"):
-                        yield chunk
-                finally:
-                    await client.close()
-
-            return StreamingResponse(
-                generate(),
-                media_type="text/event-stream",
-                headers={
-                    "Cache-Control": "no-cache",
-                    "Connection": "keep-alive",
-                },
-            )
-        else:
-            # Non-streaming response
-            try:
-                response = await client.chat_completion(data, stream=False)
-                return response.json()
-            finally:
-                await client.close()
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error in chat_completions: {e}", exc_info=True)
-        raise HTTPException(
-            status_code=500,
-            detail=ErrorResponse.from_exception(
-                error_type="internal_error",
-                message=str(e),
-            ).model_dump(),
-        )
+    return await proxy_request(
+        request,
+        req_data,
+        get_client_for_model,
+        route="chat",
+        provider="openai",
+        operation_name="chat_completions",
+    )
 
 
 @router.post("/completions")
@@ -153,54 +82,11 @@ async def completions(
     Returns:
         Completion response or streaming response
     """
-    try:
-        client = await get_client_for_model(request, req_data.model)
-
-        # Convert request to dict
-        data = req_data.model_dump(exclude_none=True)
-
-        # Get model config to check for actual_model_name override
-        app_config = request.app.state.config
-        model_config = app_config.get_model_config(req_data.model)
-        if model_config and model_config.actual_model_name:
-            # Override the model name in the request
-            data["model"] = model_config.actual_model_name
-
-        if req_data.stream:
-            # Streaming response
-            response_iter = await client.completion(data, stream=True)
-
-            async def generate():
-                try:
-                    async for chunk in stream_response(response_iter, provider="openai"):
-                        yield chunk
-                finally:
-                    await client.close()
-
-            return StreamingResponse(
-                generate(),
-                media_type="text/event-stream",
-                headers={
-                    "Cache-Control": "no-cache",
-                    "Connection": "keep-alive",
-                },
-            )
-        else:
-            # Non-streaming response
-            try:
-                response = await client.completion(data, stream=False)
-                return response.json()
-            finally:
-                await client.close()
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error in completions: {e}", exc_info=True)
-        raise HTTPException(
-            status_code=500,
-            detail=ErrorResponse.from_exception(
-                error_type="internal_error",
-                message=str(e),
-            ).model_dump(),
-        )
+    return await proxy_request(
+        request,
+        req_data,
+        get_client_for_model,
+        route="completion",
+        provider="openai",
+        operation_name="completions",
+    )
@@ -2,7 +2,10 @@
 
 import asyncio
 import logging
-from typing import Callable, Optional, TypeVar
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Dict, Hashable, Optional, TypeVar, Union
 
 import httpx
 
@@ -12,6 +15,9 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Network errors worth retrying (timeouts, refused or dropped connections)
+RETRYABLE_EXCEPTIONS = (httpx.ConnectError, httpx.TimeoutException, httpx.NetworkError)
+
 
 class RetryHandler:
     """Handles retry logic for HTTP requests with exponential backoff."""
@@ -23,6 +29,13 @@ class RetryHandler:
             config: Retry configuration
         """
         self.config = config
+        self._retry_status_codes = frozenset(config.retry_status_codes)
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+        # The backoff schedule only depends on the config, so build it once
+        self._delays = tuple(
+            self._backoff_delay(attempt) for attempt in range(config.max_retries + 1)
+        )
 
     def should_retry(self, response: Optional[httpx.Response], exception: Optional[Exception]) -> bool:
         """Determine if request should be retried.
@@ -36,36 +49,209 @@ class RetryHandler:
         """
         # Retry on specific HTTP status codes
         if response is not None:
-            return response.status_code in self.config.retry_status_codes
+            return response.status_code in self._retry_status_codes
 
         # Retry on network errors
-        if isinstance(exception, (httpx.ConnectError, httpx.TimeoutException, httpx.NetworkError)):
-            return True
+        return isinstance(exception, RETRYABLE_EXCEPTIONS)
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """Calculate the capped exponential backoff for an attempt.
 
-        return False
+        Args:
+            attempt: Attempt number (0-indexed)
+
+        Returns:
+            Delay in seconds before jitter
+        """
+        delay = self.config.initial_delay * (self.config.backoff_factor ** attempt)
+        return min(delay, self.config.max_delay)
 
     def calculate_delay(self, attempt: int) -> float:
         """Calculate delay for retry attempt with exponential backoff.
 
+        The delay is randomized downwards by up to ``jitter`` of its value so
+        concurrent requests failing together do not retry in lockstep, the
+        first retry included. With ``jitter=1`` this is full jitter: uniform
+        between zero and the backoff delay.
+
         Args:
             attempt: Current attempt number (0-indexed)
 
         Returns:
             Delay in seconds
         """
-        delay = self.config.initial_delay * (self.config.backoff_factor ** attempt)
-        return min(delay, self.config.max_delay)
+        if attempt < len(self._delays):
+            delay = self._delays[attempt]
+        else:
+            delay = self._backoff_delay(attempt)
+        if self.config.jitter:
+            delay = random.uniform(delay * (1 - self.config.jitter), delay)
+        return delay
+
+    @staticmethod
+    def parse_retry_after(response: httpx.Response) -> Optional[float]:
+        """Read the server-requested wait from a Retry-After header.
+
+        Args:
+            response: HTTP response
+
+        Returns:
+            Seconds to wait, or None if the header is missing or invalid
+        """
+        value = response.headers.get("retry-after")
+        if not value:
+            return None
+
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+
+        # HTTP-date form
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+    def _deadline(
+        self, loop: asyncio.AbstractEventLoop, total_timeout: Optional[float]
+    ) -> Optional[float]:
+        """Calculate the loop time after which no retry is started.
+
+        Args:
+            loop: Running event loop (its clock is monotonic)
+            total_timeout: Time budget in seconds (None = use the config's)
+
+        Returns:
+            Deadline in loop time, or None if retries are not time limited
+        """
+        if total_timeout is None:
+            total_timeout = self.config.total_timeout
+        if not total_timeout:
+            return None
+        return loop.time() + total_timeout
+
+    def _next_delay(
+        self,
+        attempt: int,
+        deadline: Optional[float],
+        operation_name: str,
+        failure: Union[Exception, httpx.Response],
+        retry_after: Optional[float] = None,
+    ) -> Optional[float]:
+        """Decide how long to wait before retrying a failed attempt, and log it.
+
+        Args:
+            attempt: Attempt number that failed (0-indexed)
+            deadline: Loop time after which no retry is started, if any
+            operation_name: Name of operation for logging
+            failure: Exception raised or retryable response returned
+            retry_after: Delay requested by the server, in seconds
+
+        Returns:
+            Delay in seconds, or None if no retries or time are left
+        """
+        max_retries = self.config.max_retries
+        is_response = isinstance(failure, httpx.Response)
+
+        if attempt >= max_retries:
+            logger.error(
+                "%s failed after %d retries, last %s: %s",
+                operation_name,
+                max_retries,
+                "status" if is_response else "error",
+                failure.status_code if is_response else failure,
+            )
+            return None
+
+        delay = self.calculate_delay(attempt)
+        if retry_after is not None:
+            delay = min(max(delay, retry_after), self.config.max_delay)
+        if deadline is not None:
+            delay = min(delay, deadline - asyncio.get_running_loop().time())
+            if delay <= 0:
+                logger.error(
+                    "%s failed after %d attempt(s), total timeout reached, last %s: %s",
+                    operation_name,
+                    attempt + 1,
+                    "status" if is_response else "error",
+                    failure.status_code if is_response else failure,
+                )
+                return None
+
+        if is_response:
+            logger.warning(
+                "%s returned %d, retrying in %.2fs (attempt %d/%d)",
+                operation_name,
+                failure.status_code,
+                delay,
+                attempt + 1,
+                max_retries,
+            )
+        else:
+            logger.warning(
+                "%s failed with %s: %s, retrying in %.2fs (attempt %d/%d)",
+                operation_name,
+                type(failure).__name__,
+                failure,
+                delay,
+                attempt + 1,
+                max_retries,
+            )
+        return delay
+
+    async def _single_flight(
+        self, key: Hashable, execute: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Run an execution once for all concurrent callers with the same key.
+
+        The shared execution runs as its own task, so one caller being
+        cancelled does not cancel it for the others.
+
+        Args:
+            key: Deduplication key
+            execute: Function starting the execution
+
+        Returns:
+            Result of the shared execution
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(execute())
+            self._inflight[key] = task
+
+            def _done(finished: asyncio.Future) -> None:
+                if self._inflight.get(key) is finished:
+                    del self._inflight[key]
+                # Mark a failure as retrieved even if every caller went away
+                if not finished.cancelled():
+                    finished.exception()
+
+            task.add_done_callback(_done)
+
+        return await asyncio.shield(task)
 
     async def execute_with_retry(
         self,
-        func: Callable[[], T],
+        func: Callable[[], Awaitable[T]],
         operation_name: str = "request",
+        total_timeout: Optional[float] = None,
+        dedupe_key: Optional[Hashable] = None,
     ) -> T:
-        """Execute function with retry logic.
+        """Execute function with retry logic for network errors.
+
+        Use execute_response_with_retry for HTTP requests, which also retries
+        on the configured status codes.
 
         Args:
             func: Async function to execute
             operation_name: Name of operation for logging
+            total_timeout: Stop retrying once this many seconds have passed
+                since the first attempt (defaults to the config's total_timeout)
+            dedupe_key: Concurrent calls with the same key share one execution
 
         Returns:
             Result from function
@@ -73,59 +259,86 @@ class RetryHandler:
         Raises:
             Last exception encountered if all retries fail
         """
-        last_exception: Optional[Exception] = None
-        last_response: Optional[httpx.Response] = None
+        if dedupe_key is not None:
+            return await self._single_flight(
+                dedupe_key,
+                lambda: self.execute_with_retry(func, operation_name, total_timeout),
+            )
+
+        deadline = self._deadline(asyncio.get_running_loop(), total_timeout)
 
         for attempt in range(self.config.max_retries + 1):
             try:
-                result = await func()
-
-                # If result is an httpx.Response, check if we should retry
-                if isinstance(result, httpx.Response):
-                    if not self.should_retry(result, None):
-                        return result
-
-                    last_response = result
-                    if attempt < self.config.max_retries:
-                        delay = self.calculate_delay(attempt)
-                        logger.warning(
-                            f"{operation_name} returned {result.status_code}, "
-                            f"retrying in {delay:.2f}s (attempt {attempt + 1}/{self.config.max_retries})"
-                        )
-                        await asyncio.sleep(delay)
-                        continue
-                else:
-                    return result
-
+                return await func()
             except Exception as e:
-                last_exception = e
-
                 if not self.should_retry(None, e):
                     raise
-
-                if attempt < self.config.max_retries:
-                    delay = self.calculate_delay(attempt)
-                    logger.warning(
-                        f"{operation_name} failed with {type(e).__name__}: {e}, "
-                        f"retrying in {delay:.2f}s (attempt {attempt + 1}/{self.config.max_retries})"
-                    )
-                    await asyncio.sleep(delay)
-                else:
+                delay = self._next_delay(attempt, deadline, operation_name, e)
+                if delay is None:
                     raise
+            await asyncio.sleep(delay)
 
-        # All retries exhausted
-        if last_response:
-            logger.error(
-                f"{operation_name} failed after {self.config.max_retries} retries, "
-                f"last status: {last_response.status_code}"
-            )
-            return last_response
+        raise RuntimeError(f"{operation_name} failed with unknown error")
 
-        if last_exception:
-            logger.error(
-                f"{operation_name} failed after {self.config.max_retries} retries, "
-                f"last error: {last_exception}"
+    async def execute_response_with_retry(
+        self,
+        func: Callable[[], Awaitable[httpx.Response]],
+        operation_name: str = "request",
+        total_timeout: Optional[float] = None,
+        dedupe_key: Optional[Hashable] = None,
+    ) -> httpx.Response:
+        """Execute HTTP request with retry logic.
+
+        Retries on network errors and on the configured status codes. If the
+        last attempt still returns a retryable status, that response is
+        returned rather than raised.
+
+        ``func`` should send through a long-lived, pooled client (as the
+        provider clients do with the application's shared httpx client) so
+        retries go out on warm keep-alive connections.
+
+        Args:
+            func: Async function sending the request
+            operation_name: Name of operation for logging
+            total_timeout: Stop retrying once this many seconds have passed
+                since the first attempt (defaults to the config's total_timeout)
+            dedupe_key: Concurrent calls with the same key share one execution
+
+        Returns:
+            HTTP response
+
+        Raises:
+            Last exception encountered if all retries fail
+        """
+        if dedupe_key is not None:
+            return await self._single_flight(
+                dedupe_key,
+                lambda: self.execute_response_with_retry(func, operation_name, total_timeout),
             )
-            raise last_exception
+
+        deadline = self._deadline(asyncio.get_running_loop(), total_timeout)
+
+        for attempt in range(self.config.max_retries + 1):
+            try:
+                response = await func()
+            except Exception as e:
+                if not self.should_retry(None, e):
+                    raise
+                delay = self._next_delay(attempt, deadline, operation_name, e)
+                if delay is None:
+                    raise
+            else:
+                if not self.should_retry(response, None):
+                    return response
+                delay = self._next_delay(
+                    attempt,
+                    deadline,
+                    operation_name,
+                    response,
+                    retry_after=self.parse_retry_after(response),
+                )
+                if delay is None:
+                    return response
+            await asyncio.sleep(delay)
 
         raise RuntimeError(f"{operation_name} failed with unknown error")
@@ -1,53 +1,212 @@
 """Streaming utilities for SSE responses."""
 
+import asyncio
+import contextlib
 import json
 import logging
-from typing import AsyncIterator
+from functools import lru_cache
+from typing import AsyncGenerator, AsyncIterator, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# SSE framing
+_SSE_DATA_PREFIX = b"data: "
+_SSE_EVENT_END = b"\n\n"
 
-async def stream_response(
+# Error event with only the (JSON-encoded) message left to fill in
+_ERROR_EVENT_TEMPLATE = '{"error": {"message": %s, "type": "stream_error"}}'
+
+
+@lru_cache(maxsize=64)
+def _error_event(message: str) -> bytes:
+    """Build the SSE event sent when a stream fails.
+
+    Args:
+        message: Error message
+
+    Returns:
+        SSE formatted error event
+    """
+    error_data = _ERROR_EVENT_TEMPLATE % json.dumps(message)
+    return _SSE_DATA_PREFIX + error_data.encode() + _SSE_EVENT_END
+
+
+# Marks the end of a read-ahead buffer
+_END_OF_STREAM = object()
+
+
+async def _read_ahead(
+    response_iter: AsyncIterator[bytes], max_buffered_chunks: int
+) -> AsyncIterator[bytes]:
+    """Read upstream chunks ahead of the consumer into a bounded buffer.
+
+    Reading stops while the buffer is full, so a slow client still slows
+    down the upstream read instead of growing memory.
+
+    Args:
+        response_iter: Async iterator of response bytes
+        max_buffered_chunks: Maximum number of chunks held in the buffer
+
+    Yields:
+        Response bytes in upstream order
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max_buffered_chunks)
+
+    async def produce() -> None:
+        try:
+            async for chunk in response_iter:
+                await queue.put(chunk)
+        except Exception as e:
+            await queue.put(e)
+        else:
+            await queue.put(_END_OF_STREAM)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            item = await queue.get()
+            if item is _END_OF_STREAM:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        # The client may disconnect before the upstream stream ends. Wait for
+        # the cancelled read to stop before the response gets closed.
+        producer.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await producer
+
+
+async def _coalesce(
     response_iter: AsyncIterator[bytes],
-    provider: str = "unknown",
-) -> AsyncIterator[str]:
-    """Stream response from provider and format as SSE.
+    min_bytes: Optional[int],
+    max_wait: Optional[float],
+) -> AsyncIterator[bytes]:
+    """Merge small upstream chunks into larger writes.
+
+    Buffered data is sent once it reaches ``min_bytes`` or once its first
+    chunk has waited ``max_wait`` seconds, whichever comes first. The next
+    upstream read keeps running across flushes, so it is never cancelled
+    mid-read.
 
     Args:
         response_iter: Async iterator of response bytes
-        provider: Provider name for logging
+        min_bytes: Flush once this many bytes are buffered (None = no size limit)
+        max_wait: Flush once data has been buffered this long (None = no time limit)
 
     Yields:
-        SSE formatted strings
+        Response bytes in upstream order
     """
+    loop = asyncio.get_running_loop()
+    iterator = response_iter.__aiter__()
+    buffer = bytearray()
+    deadline = 0.0
+    pending: Optional[asyncio.Future] = None
+
     try:
-        async for chunk in response_iter:
-            if not chunk:
-                continue
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(iterator.__anext__())
+
+            if buffer and max_wait:
+                # Wait for the next chunk only until the buffered data is due
+                await asyncio.wait((pending,), timeout=max(deadline - loop.time(), 0))
+                if not pending.done():
+                    yield bytes(buffer)
+                    buffer.clear()
+                    continue
+            else:
+                await asyncio.wait((pending,))
 
-            # Decode bytes to string
+            done, pending = pending, None
             try:
-                text = chunk.decode("utf-8")
-            except UnicodeDecodeError:
-                logger.warning(f"Failed to decode chunk from {provider}")
+                chunk = done.result()
+            except StopAsyncIteration:
+                break
+            except Exception:
+                # Send what was received before the error
+                if buffer:
+                    yield bytes(buffer)
+                    buffer.clear()
+                raise
+
+            if min_bytes and not buffer and len(chunk) >= min_bytes:
+                yield chunk
                 continue
 
+            if not buffer:
+                deadline = loop.time() + (max_wait or 0)
+            buffer += chunk
+            if min_bytes and len(buffer) >= min_bytes:
+                yield bytes(buffer)
+                buffer.clear()
+
+        if buffer:
+            yield bytes(buffer)
+    finally:
+        if pending is not None:
+            # Wait for the cancelled read to stop before the response gets
+            # closed; whatever it returned or raised is no longer needed
+            pending.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await pending
+
+
+async def stream_response(
+    response_iter: AsyncIterator[bytes],
+    provider: str = "unknown",
+    max_buffered_chunks: Optional[int] = None,
+    coalesce_bytes: Optional[int] = None,
+    coalesce_ms: Optional[float] = None,
+) -> AsyncIterator[bytes]:
+    """Stream response from provider as SSE.
+
+    Provider streams are already SSE formatted, so chunks are passed through
+    as bytes without decoding. Each chunk is read from upstream only after
+    the previous one was sent, so the consumer must not buffer unboundedly;
+    Starlette's StreamingResponse awaits every send.
+
+    Args:
+        response_iter: Async iterator of non-empty response bytes (such as
+            httpx's ``aiter_bytes``, which never yields empty chunks)
+        provider: Provider name for logging
+        max_buffered_chunks: Read up to this many chunks ahead of the client
+            (None = read one chunk at a time)
+        coalesce_bytes: Merge chunks until this many bytes are buffered
+            (pair with coalesce_ms, or data may be held until the stream ends)
+        coalesce_ms: Send merged chunks after at most this many milliseconds
+
+    Yields:
+        SSE formatted bytes
+    """
+    # Wrappers are closed explicitly so that their background reads have
+    # stopped before the upstream response is closed
+    wrappers: List[AsyncGenerator[bytes, None]] = []
+    if max_buffered_chunks:
+        response_iter = _read_ahead(response_iter, max_buffered_chunks)
+        wrappers.append(response_iter)
+    if coalesce_bytes or coalesce_ms:
+        max_wait = coalesce_ms / 1000 if coalesce_ms else None
+        response_iter = _coalesce(response_iter, coalesce_bytes, max_wait)
+        wrappers.append(response_iter)
+
+    try:
+        async for chunk in response_iter:
             # Yield the chunk as-is (provider format is already SSE)
-            yield text
+            yield chunk
 
     except Exception as e:
         logger.error(f"Error streaming from {provider}: {e}")
         # Send error event
-        error_data = json.dumps({
-            "error": {
-                "message": f"Streaming error: {str(e)}",
-                "type": "stream_error",
-            }
-        })
-        yield f"data: {error_data}\n\n"
+        yield _error_event(f"Streaming error: {str(e)}")
 
+    finally:
+        for wrapper in reversed(wrappers):
+            await wrapper.aclose()
 
-def format_sse_event(data: str, event: str = None) -> str:
+
+def format_sse_event(data: str, event: str = None) -> bytes:
     """Format data as SSE event.
 
     Args:
@@ -55,14 +214,11 @@ def format_sse_event(data: str, event: str = None) -> str:
         event: Optional event type
 
     Returns:
-        SSE formatted string
+        SSE formatted bytes
     """
-    lines = []
     if event:
-        lines.append(f"event: {event}")
-    lines.append(f"data: {data}")
-    lines.append("")
-    return "\n".join(lines)
+        return b"event: " + event.encode() + b"\n" + _SSE_DATA_PREFIX + data.encode() + b"\n"
+    return _SSE_DATA_PREFIX + data.encode() + b"\n"
 
 
 def parse_sse_line(line: str) -> tuple[str, str]:
@@ -74,8 +230,33 @@ def parse_sse_line(line: str) -> tuple[str, str]:
     Returns:
         Tuple of (field, value)
     """
-    if ":" not in line:
+    field, sep, value = line.partition(":")
+    if not sep:
         return "", ""
 
-    field, _, value = line.partition(":")
-    return field.strip(), value.lstrip()
+    # Only a single leading space is part of the separator (SSE spec)
+    if value[:1] == " ":
+        value = value[1:]
+    return field.strip(), value
+
+
+def parse_sse_line_bytes(line: bytes) -> tuple[bytes, bytes]:
+    """Parse a raw SSE line into field and value without decoding it.
+
+    Splitting on the ASCII colon is safe in UTF-8, so only values that are
+    actually needed have to be decoded by the caller.
+
+    Args:
+        line: SSE line bytes
+
+    Returns:
+        Tuple of (field, value) bytes
+    """
+    field, sep, value = line.partition(b":")
+    if not sep:
+        return b"", b""
+
+    # Only a single leading space is part of the separator (SSE spec)
+    if value[:1] == b" ":
+        value = value[1:]
+    return field.strip(), value